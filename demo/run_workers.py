@@ -1,10 +1,19 @@
 import logging
-import time
+import queue
+from logging.handlers import QueueHandler, QueueListener
 
-from demo.workers import Worker1, Worker2, WorkerEvent
-from eventdispatch import post_event
+from demo.workers import Worker1, Worker2, WorkerEvent, STEP_SIM_WORK_SEC
+from eventdispatch import EventDispatchManager, post_event
 
-logging.basicConfig(level=logging.INFO)
+# Have workers only queue up log records, and format/write them on a separate (listener) thread, so logging doesn't
+# hold up handling of events.
+log_queue = queue.SimpleQueue()
+logging.basicConfig(level=logging.INFO, handlers=[QueueHandler(log_queue)])
+log_listener = QueueListener(log_queue, logging.StreamHandler())
+log_listener.start()
+
+# Number of simulated steps on the critical path (used to bound how long to wait for the demo to finish).
+STEP_COUNT = 4
 
 Worker1()
 Worker2()
@@ -12,4 +21,8 @@ Worker2()
 # Generate initial event to kick things off.
 post_event(WorkerEvent.APP_STARTED)
 
-time.sleep(6)
+# Wait for all events (and the ones they trigger) to be handled (instead of sleeping for a fixed amount of time).
+EventDispatchManager().default_dispatch.wait_for_idle(timeout=STEP_COUNT * STEP_SIM_WORK_SEC + 2)
+
+# Write out any log records still queued up.
+log_listener.stop()
@@ -1,13 +1,10 @@
 import logging
 import time
-from typing import Any
 
 from eventdispatch import Event, register_for_events, unregister_from_events, post_event, NamespacedEnum
 
 STEP_SIM_WORK_SEC = 1
 
-logging.basicConfig(level=logging.INFO)
-
 
 class WorkerEvent(NamespacedEnum):
     APP_STARTED = 'started'
@@ -21,86 +18,98 @@ class WorkerEvent(NamespacedEnum):
 
 
 class Worker1:
-    desired_events = [
-        WorkerEvent.APP_STARTED,
-        WorkerEvent.STEP2_COMPLETED,
-        WorkerEvent.STEP3_COMPLETED,
-    ]
+    __slots__ = ('logger', 'actions')
 
-    def __init__(self):
-        register_for_events(self.on_event, self.desired_events)
+    desired_events = (
+        WorkerEvent.APP_STARTED.namespaced_value,
+        WorkerEvent.STEP2_COMPLETED.namespaced_value,
+        WorkerEvent.STEP3_COMPLETED.namespaced_value,
+    )
 
-    def on_event(self, event: Event):
-        log_event(self, event)
+    def __init__(self):
+        self.logger = logging.getLogger(self.__class__.__name__)
 
         # Map events that occurred to action to perform.
-        if event.name == WorkerEvent.APP_STARTED.namespaced_value:
-            self.do_step1()
+        self.actions = {
+            WorkerEvent.APP_STARTED.namespaced_value: self.do_step1,
+            WorkerEvent.STEP2_COMPLETED.namespaced_value: self.do_step3,
+            WorkerEvent.STEP3_COMPLETED.namespaced_value: self.done,
+        }
+        register_for_events(self.on_event, self.desired_events)
 
-        elif event.name == WorkerEvent.STEP2_COMPLETED.namespaced_value:
-            self.do_step3()
+    def on_event(self, event: Event):
+        log_event(self.logger, event)
 
-        elif event.name == WorkerEvent.STEP3_COMPLETED.namespaced_value:
-            # Done (cleanup).
-            unregister_from_events(self.on_event, self.desired_events)
+        action = self.actions.get(event.name)
+        if action:
+            action()
 
     def do_step1(self):
-        log_task(self, 'step 1')
+        log_task(self.logger, 'step 1')
         wait(STEP_SIM_WORK_SEC)
         post_event(WorkerEvent.STEP1_COMPLETED)
 
     def do_step3(self):
-        log_task(self, 'step 3')
+        log_task(self.logger, 'step 3')
         wait(STEP_SIM_WORK_SEC)
         post_event(WorkerEvent.STEP3_COMPLETED)
 
+    def done(self):
+        # Cleanup.
+        unregister_from_events(self.on_event, self.desired_events)
+
 
 class Worker2:
-    desired_events = [
-        WorkerEvent.STEP1_COMPLETED,
-        WorkerEvent.STEP3_COMPLETED,
-        WorkerEvent.STEP4_COMPLETED,
-    ]
+    __slots__ = ('logger', 'actions')
 
-    def __init__(self):
-        register_for_events(self.on_event, self.desired_events)
+    desired_events = (
+        WorkerEvent.STEP1_COMPLETED.namespaced_value,
+        WorkerEvent.STEP3_COMPLETED.namespaced_value,
+        WorkerEvent.STEP4_COMPLETED.namespaced_value,
+    )
 
-    def on_event(self, event: Event):
-        log_event(self, event)
+    def __init__(self):
+        self.logger = logging.getLogger(self.__class__.__name__)
 
         # Map events that occurred to action to perform.
-        if event.name == WorkerEvent.STEP1_COMPLETED.namespaced_value:
-            self.do_step2()
+        self.actions = {
+            WorkerEvent.STEP1_COMPLETED.namespaced_value: self.do_step2,
+            WorkerEvent.STEP3_COMPLETED.namespaced_value: self.do_step4,
+            WorkerEvent.STEP4_COMPLETED.namespaced_value: self.done,
+        }
+        register_for_events(self.on_event, self.desired_events)
 
-        elif event.name == WorkerEvent.STEP3_COMPLETED.namespaced_value:
-            self.do_step4()
+    def on_event(self, event: Event):
+        log_event(self.logger, event)
 
-        elif event.name == WorkerEvent.STEP4_COMPLETED.namespaced_value:
-            # Done (cleanup).
-            unregister_from_events(self.on_event, self.desired_events)
+        action = self.actions.get(event.name)
+        if action:
+            action()
 
     def do_step2(self):
-        log_task(self, 'step 2')
+        log_task(self.logger, 'step 2')
         wait(STEP_SIM_WORK_SEC)
         post_event(WorkerEvent.STEP2_COMPLETED)
 
     def do_step4(self):
-        log_task(self, 'step 4')
+        log_task(self.logger, 'step 4')
         wait(STEP_SIM_WORK_SEC)
         post_event(WorkerEvent.STEP4_COMPLETED)
 
+    def done(self):
+        # Cleanup.
+        unregister_from_events(self.on_event, self.desired_events)
+
 
 def wait(amount: float):
     time.sleep(amount)
 
 
-def log_task(for_class: Any, task_name: str):
-    get_logger(for_class).info(f' Doing: {task_name}\n')
-
-
-def log_event(for_class: Any, event: Event):
-    get_logger(for_class).info(f" Got event '{event.name}'\n{event.dict}\n")
+def log_task(logger: logging.Logger, task_name: str):
+    logger.info(' Doing: %s\n', task_name)
 
 
-def get_logger(cls: Any):
-    return logging.getLogger(cls.__class__.__name__)
+def log_event(logger: logging.Logger, event: Event):
+    # Skip building event's dict (done on demand) if message won't be logged.
+    if logger.isEnabledFor(logging.INFO):
+        logger.info(" Got event '%s'\n%s\n", event.name, event.dict)
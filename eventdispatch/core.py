@@ -1,12 +1,17 @@
+import asyncio
+import inspect
+import itertools
 import json
 import logging
+import queue
+import sys
 import threading
 import time
 import traceback
 from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from enum import Enum
-from queue import Queue
-from typing import Callable, Dict, Any, Union, List
+from typing import Callable, Dict, Any, Union, List, Tuple
 
 
 class NamespacedEnum(Enum):
@@ -15,78 +20,100 @@ class NamespacedEnum(Enum):
     to return desired namespace.
     """
 
-    def __init__(self, _):
-        self.__namespace = self.get_namespace()
+    def __init__(self, value):
+        namespace = self.get_namespace()
+
+        # Build (interned) namespaced value once as a plain attribute (enum members are constant).
+        self.namespaced_value: str = sys.intern(f'{namespace}.{value}') if namespace else value
 
     def get_namespace(self) -> str:
         pass
 
-    @property
-    def namespaced_value(self) -> str:
-        return f'{self.__namespace}.{self.value}' if self.__namespace else self.value
-
 
 class Data:
+    # Not name-mangled, so subclasses (e.g. Event) can keep their dictionary form in the same slot.
+    __slots__ = ('_data',)
+
     def __init__(self, data: Dict[str, Any]):
         if data is None:
             raise InvalidDataError()
-        self.__data = data
+        self._data = data
 
     def get(self, key: str, data: Dict[str, Any] = None):
-        data = data if data else self.__data
+        data = self.dict if data is None else data
         try:
             return data[key]
         except KeyError:
-            raise MissingKeyError(key, data)
+            raise MissingKeyError(key, data) from None
 
     @property
     def dict(self) -> Dict[str, Any]:
-        return self.__data
+        return self._data
 
     @property
     def json(self) -> str:
-        return json.dumps(self.__data)
+        return json.dumps(self.dict)
 
 
 class Event(Data):
-    __lock = threading.Lock()
-    __id = 0
+    __slots__ = ('__event_id', '__time', '__name', '__payload')
+
+    # Counter's next() is a single (atomic) call, so IDs can be generated without a lock.
+    __ids = itertools.count(1)
 
     def __init__(self, name: str, payload: Dict[str, Any] = None):
-        super(Event, self).__init__({
-            'id': Event.generate_id(),
-            'time': time.time(),
-            'name': name,
-            'payload': payload if payload else {}
-        })
+        # Keep event fields as-is, and only build the dictionary form of the event when it's asked for.
+        self.__event_id = Event.generate_id()
+        self.__time = time.time()
+        self.__name = name
+        self.__payload = payload if payload is not None else {}
+        self._data = None
 
     @staticmethod
     def generate_id():
-        Event.__lock.acquire()
-        Event.__id += 1
-        event_id = Event.__id
-        Event.__lock.release()
-        return event_id
+        return next(Event.__ids)
 
     @property
     def id(self) -> int:
-        return self.get('id')
+        return self.__event_id
 
     @property
     def time(self) -> float:
-        return self.get('time')
+        return self.__time
 
     @property
     def name(self) -> str:
-        return self.get('name')
+        return self.__name
 
     @property
     def payload(self) -> Dict[str, Any]:
-        return self.get('payload')
+        return self.__payload
+
+    @property
+    def dict(self) -> Dict[str, Any]:
+        if self._data is None:
+            self._data = {
+                'id': self.__event_id,
+                'time': self.__time,
+                'name': self.__name,
+                'payload': self.__payload
+            }
+        return self._data
 
     @staticmethod
     def from_dict(data: Dict[str, Any]):
-        return Event(data.get('name'), data.get('payload'))
+        # Events being created from data without ID and time get new ones.
+        if 'id' not in data or 'time' not in data:
+            return Event(data.get('name'), data.get('payload'))
+
+        # Keep ID and time of event being restored (instead of generating new ones).
+        event = Event.__new__(Event)
+        event.__event_id = data['id']
+        event.__time = data['time']
+        event.__name = data.get('name')
+        event.__payload = data.get('payload') if data.get('payload') is not None else {}
+        event._data = None
+        return event
 
 
 def register_for_events(handler: Callable[[Event], None], events: [Union[str, Enum, NamespacedEnum]]):
@@ -136,9 +163,10 @@ class NotifiableError(Exception):
         if 'error' not in payload:
             payload['error'] = error
 
-        if exception:
+        # Only format stacktrace (which is costly) if the error event will get to a handler.
+        if exception and EventDispatchManager().default_dispatch.has_handlers(error):
             payload['stacktrace'] = ''.join(
-                traceback.format_exception(etype=type(exception), value=exception, tb=exception.__traceback__))
+                traceback.format_exception(type(exception), exception, exception.__traceback__))
 
         if message:
             payload['message'] = message
@@ -174,6 +202,10 @@ class EventDispatchEvent(NamespacedEnum):
         return 'event_dispatch'
 
 
+# Handlers to notify per event name, and handlers to notify for all events.
+HandlersSnapshot = Tuple[Dict[str, Tuple[Callable, ...]], Tuple[Callable, ...]]
+
+
 class EventDispatch:
     __ALL_EVENTS = '*'
     __EVENT_LOG_SIZE = 5
@@ -201,22 +233,57 @@ class EventDispatch:
 
     @property
     def event_handlers(self) -> Dict[str, List[Callable]]:
-        return self.__event_handlers
+        return {event: list(handlers) for event, handlers in self.__event_handlers.items()}
 
     @property
     def all_event_handlers(self) -> [Callable]:
-        return self.__event_handlers.get(self.__ALL_EVENTS, [])
+        return list(self.__event_handlers.get(self.__ALL_EVENTS, {}))
+
+    @property
+    def handler_count(self) -> int:
+        return self.__handler_count
 
     def clear_registered_handlers(self):
-        self.__event_handlers: Dict[str, List[Callable]] = {}
+        self.__event_handlers: Dict[str, Dict[Callable, None]] = {}
+        self.__handlers_to_notify: HandlersSnapshot = ({}, ())
+        self.__handler_count = 0
 
     # -------------------------------------------------------------------------------------------------------
 
-    def __init__(self, channel: str = ''):
+    def __init__(self, channel: str = '', max_workers: int = None, is_synchronous: bool = False):
+        """
+        Creates an event dispatch
+        :param channel: optional name of channel the dispatch is for
+        :param max_workers: optional max number of handlers to notify at the same time (using a pool of that many
+            threads); by default, there's no max (idle threads are reused, and threads are added when all are busy), so
+            handlers that block (e.g. waiting for another event) can't hold up other handlers, which can happen when a
+            max is set
+        :param is_synchronous: True to notify handlers in the posting thread (before posting returns)
+        """
         self.__channel = channel
+        self.__is_synchronous = is_synchronous
         self.__lock = threading.Lock()
-        self.__event_handlers: Dict[str, List[Callable]] = {}
-        self.__event_queue: Queue = Queue()
+        # Handlers per event, kept as insertion-ordered sets (dict keys) for fast membership checks and removal.
+        self.__event_handlers: Dict[str, Dict[Callable, None]] = {}
+        self.__handlers_to_notify: HandlersSnapshot = ({}, ())
+        # Number of (handler, event) registrations, kept up to date so it doesn't need to be counted.
+        self.__handler_count = 0
+
+        # Notify handlers using a pool of threads (so handlers don't need to implement their own thread), capped if the
+        # number of handlers notified at the same time is to be limited, and otherwise made of worker threads that wait
+        # (on their own task queue) while idle, so they can be reused. No threads are used if notifying handlers
+        # synchronously (in the posting thread).
+        self.__executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='event_dispatch') \
+            if max_workers and not is_synchronous else None
+        self.__idle_worker_tasks = queue.SimpleQueue()
+
+        # Events waiting for handlers that are busy with an earlier event (so each handler gets its events in order).
+        self.__pending_handler_events: Dict[Callable, deque] = {}
+        self.__pending_handler_events_lock = threading.Lock()
+
+        # Number of handler notifications that have been queued but not yet completed (to know when dispatch is idle).
+        self.__pending_notification_count = 0
+        self.__idle_condition = threading.Condition()
 
         # --- For testing purposes ------------------------------------------------------------------------------
         self.__event_log = deque(maxlen=self.__EVENT_LOG_SIZE)
@@ -224,8 +291,6 @@ class EventDispatch:
         self.__log_event_if_no_handlers: bool = False
         # -------------------------------------------------------------------------------------------------------
 
-        threading.Thread(target=self.monitor_event_queue, daemon=True).start()
-
     def register(self, handler: Callable, events: [str]):
         self.__validate_events(events)
 
@@ -233,10 +298,14 @@ class EventDispatch:
             # Registering for all events.
             events = [self.__ALL_EVENTS]
 
-        is_registered_for_event = False
-        for event in events:
-            if self.__register_for_event(handler, event):
-                is_registered_for_event = True
+        with self.__lock:
+            is_registered_for_event = False
+            for event in events:
+                if self.__register_for_event(handler, event):
+                    is_registered_for_event = True
+
+            if is_registered_for_event:
+                self.__update_handlers_to_notify()
 
         if is_registered_for_event:
             self.__post_admin_event_registration(handler, events, is_registered=True)
@@ -245,75 +314,203 @@ class EventDispatch:
     def unregister(self, handler: Callable, events: [str]):
         self.__validate_events(events)
 
-        self.__lock.acquire()
-
         if not events:
             # Unregistering from all events.
             events = [self.__ALL_EVENTS]
 
-        is_unregistered_for_event = False
-        for event in events:
-            if self.__unregister_from_event(handler, event):
-                is_unregistered_for_event = True
+        with self.__lock:
+            is_unregistered_for_event = False
+            for event in events:
+                if self.__unregister_from_event(handler, event):
+                    is_unregistered_for_event = True
 
-        self.__lock.release()
+            if is_unregistered_for_event:
+                self.__update_handlers_to_notify()
 
         if is_unregistered_for_event:
             self.__post_admin_event_registration(handler, events, is_registered=False)
             self.__log_message_unregistered(handler, events)
 
     def post_event(self, name: str, payload: Dict[str, Any] = None, exclude_handler: Callable[[Event], None] = None):
-        self.__lock.acquire()
-
-        payload = payload if payload else {}
-        event = Event(name, payload)
+        # Get handlers to notify for event (events without their own handlers only go to all-event handlers). Handlers
+        # are an immutable snapshot that gets replaced as a whole, so no lock is needed to read them.
+        handlers_by_event, all_event_handlers = self.__handlers_to_notify
+        event_handlers = handlers_by_event.get(name, all_event_handlers)
 
-        # Get handlers for event.
-        event_handlers = self.__event_handlers.get(name, [])
+        if exclude_handler in event_handlers:
+            event_handlers = [handler for handler in event_handlers if handler != exclude_handler]
 
-        # Get all-event handlers.
-        all_event_handlers = self.__event_handlers.get(self.__ALL_EVENTS, [])
+        # Skip notifying if there's no handler registered for event (and only create event if it needs to be logged).
+        if not event_handlers:
+            if self.__log_event and self.__log_event_if_no_handlers:
+                self.__event_log.append(Event(name, payload))
+            if self.__logger.isEnabledFor(logging.DEBUG):
+                self.__log_message_not_propagating_event(name)
+            return
 
-        # Combine handlers and all-event handlers into one unique list (in case some handlers are registered for both).
-        for handler in all_event_handlers:
-            if handler not in event_handlers and handler != exclude_handler:
-                event_handlers.append(handler)
+        event = Event(name, payload)
 
         # Log event posting info.
-        if self.__log_event and (event_handlers or self.__log_event_if_no_handlers):
+        if self.__log_event:
             self.__event_log.append(event)
 
-        # Skip notifying if there's no handler registered for event.
-        if not event_handlers:
-            self.__log_message_not_propagating_event(name)
-            self.__lock.release()
+        with self.__idle_condition:
+            self.__pending_notification_count += len(event_handlers)
+
+        if self.__is_synchronous:
+            for i, handler in enumerate(event_handlers):
+                try:
+                    self.__notify_handler(handler, event)
+                except BaseException:
+                    # Handler raised an exception that's not caught (e.g. SystemExit), which stops notifying the rest.
+                    self.__on_notifications_done(len(event_handlers) - i - 1)
+                    raise
+        else:
+            # Queue up handler notifications (so event order would be maintained per handler), and return right away.
+            for handler in event_handlers:
+                self.__queue_notification(handler, event)
+
+        if self.__logger.isEnabledFor(logging.DEBUG):
+            self.__log_message_posted_event(event)
+
+    def has_handlers(self, name: str) -> bool:
+        """
+        Checks if posting the specified event would notify any handlers
+        :param name: event name
+        :return: True if there are handlers registered for the event (or for all events), False otherwise
+        """
+        handlers_by_event, all_event_handlers = self.__handlers_to_notify
+        return name in handlers_by_event or bool(all_event_handlers)
+
+    def wait_for_idle(self, timeout: float = None) -> bool:
+        """
+        Waits until all posted events have been handled (including events posted by handlers while handling events).
+        Must not be called from a handler (or code it calls), since the handler being run counts as not yet handled,
+        so it would wait forever (or until timed out).
+        :param timeout: optional max time (in seconds) to wait
+        :return: True if dispatch is idle, False if timed out
+        """
+        with self.__idle_condition:
+            return self.__idle_condition.wait_for(lambda: self.__pending_notification_count == 0, timeout)
+
+    def __queue_notification(self, handler: Callable, event: Event):
+        with self.__pending_handler_events_lock:
+            pending_events = self.__pending_handler_events.get(handler)
+            if pending_events is not None:
+                # Handler is busy, it will get event once done with earlier events.
+                pending_events.append(event)
+                return
+            self.__pending_handler_events[handler] = deque()
+
+        self.__start_notifying_handler(handler, event)
+
+    def __start_notifying_handler(self, handler: Callable, event: Event):
+        try:
+            self.__notify_handler_in_worker(handler, event)
+        except BaseException:
+            # Could not get a thread to notify handler in (e.g. can't start new thread), so handler is no longer busy,
+            # and neither its event nor any events queued for it since will be handled.
+            with self.__pending_handler_events_lock:
+                pending_events = self.__pending_handler_events.pop(handler)
+            self.__on_notifications_done(1 + len(pending_events))
+            raise
+
+    def __notify_handler_in_worker(self, handler: Callable, event: Event):
+        if self.__executor:
+            self.__executor.submit(self.__notify_handler_in_order, handler, event)
             return
 
-        # Notify all handlers using threads (so handlers don't need to implement their own thread).
-        for handler in event_handlers:
-            # Add thread to notify handler onto event queue (so event order would be maintained per handler).
-            self.__event_queue.put(threading.Thread(target=handler, args=[event]))
+        try:
+            worker_tasks = self.__idle_worker_tasks.get_nowait()
+        except queue.Empty:
+            # All worker threads are busy, so add one.
+            worker_tasks = queue.SimpleQueue()
+            threading.Thread(target=self.__run_worker, args=(worker_tasks,), name='event_dispatch', daemon=True).start()
+        worker_tasks.put((handler, event))
+
+    def __run_worker(self, tasks: queue.SimpleQueue):
+        while True:
+            handler, event = tasks.get()
+            self.__notify_handler_in_order(handler, event)
+
+            # Wait for next handler to notify (as an idle worker).
+            self.__idle_worker_tasks.put(tasks)
 
-        self.__log_message_posted_event(event)
+    def __notify_handler_in_order(self, handler: Callable, event: Event):
+        try:
+            while True:
+                self.__notify_handler(handler, event)
+
+                with self.__pending_handler_events_lock:
+                    pending_events = self.__pending_handler_events[handler]
+                    if not pending_events:
+                        del self.__pending_handler_events[handler]
+                        return
+                    event = pending_events.popleft()
+        except BaseException:
+            # Handler raised an exception that's not caught while handling (e.g. SystemExit), so continue notifying it
+            # of its other events in another thread (instead of leaving it marked as busy, with its events stuck).
+            with self.__pending_handler_events_lock:
+                pending_events = self.__pending_handler_events[handler]
+                next_event = pending_events.popleft() if pending_events else None
+                if next_event is None:
+                    del self.__pending_handler_events[handler]
+            if next_event is not None:
+                self.__start_notifying_handler(handler, next_event)
+            raise
+
+    def __notify_handler(self, handler: Callable, event: Event):
+        is_done = True
+        try:
+            result = handler(event)
+
+            # Run handler to completion if it's a coroutine (async) handler.
+            if inspect.iscoroutine(result):
+                is_done = self.__run_coroutine(handler, event, result)
+        except Exception:
+            self.__log_message_handler_failed(handler, event)
+        finally:
+            if is_done:
+                self.__on_notifications_done()
+
+    def __run_coroutine(self, handler: Callable, event: Event, coroutine) -> bool:
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            loop = None
 
-        self.__lock.release()
+        if not loop:
+            # No event loop running in this thread, so run coroutine in its own loop (until it's done).
+            asyncio.run(coroutine)
+            return True
 
-    def monitor_event_queue(self):
-        while True:
-            thread = self.__event_queue.get()
-            thread.start()
-            self.__event_queue.task_done()
+        # Event loop is already running in this thread (e.g. event posted synchronously from async code), so schedule
+        # coroutine on that loop instead (notification is done once the coroutine is done).
+        task = loop.create_task(coroutine)
+        task.add_done_callback(lambda done_task: self.__on_coroutine_done(handler, event, done_task))
+        return False
+
+    def __on_coroutine_done(self, handler: Callable, event: Event, task: asyncio.Task):
+        if not task.cancelled() and task.exception():
+            self.__log_message_handler_failed(handler, event, task.exception())
+        self.__on_notifications_done()
+
+    def __on_notifications_done(self, count: int = 1):
+        with self.__idle_condition:
+            self.__pending_notification_count -= count
+            if self.__pending_notification_count == 0:
+                self.__idle_condition.notify_all()
 
     @staticmethod
     def to_string_events(events: [Any]) -> [str]:
-        string_events = []
-        for event in events:
-            string_events.append(EventDispatch.to_string_event(event))
-        return string_events
+        return [EventDispatch.to_string_event(event) for event in events]
 
     @staticmethod
     def to_string_event(event: [Any]) -> str:
-        if isinstance(event, NamespacedEnum):
+        # Event names are usually strings already, so check for that first.
+        if type(event) is str:
+            return event
+        elif isinstance(event, NamespacedEnum):
             return str(event.namespaced_value)
         elif isinstance(event, Enum):
             return str(event.value)
@@ -321,30 +518,44 @@ class EventDispatch:
             return event
 
     def __register_for_event(self, handler: Callable, event: str) -> bool:
-        try:
-            handlers = self.__event_handlers[event]
-            # Skip adding handler if already registered for event.
-            if handler not in handlers:
-                handlers.append(handler)
-                return True
-        except KeyError:
-            # First handler for event.
-            self.__event_handlers[event] = [handler]
-            return True
-        return False
+        # Intern event name used as key, so lookups with the same (e.g. namespaced enum) name can match by identity.
+        if type(event) is str:
+            event = sys.intern(event)
+        handlers = self.__event_handlers.setdefault(event, {})
+
+        # Skip adding handler if already registered for event.
+        if handler in handlers:
+            return False
+        handlers[handler] = None
+        self.__handler_count += 1
+        return True
 
     def __unregister_from_event(self, handler: Callable, event: str) -> bool:
-        try:
-            handlers = self.__event_handlers.get(event, [])
-            if handler not in handlers:
-                # Nothing to do...handler is not registered for event.
-                return False
-            handlers.remove(handler)
-        except KeyError:
+        handlers = self.__event_handlers.get(event, {})
+        if handler not in handlers:
             # Nothing to do...handler is not registered for event.
             return False
+        del handlers[handler]
+        self.__handler_count -= 1
+
+        # Drop event entry once it has no more handlers (so lookups for it stay a plain miss).
+        if not handlers:
+            del self.__event_handlers[event]
         return True
 
+    def __update_handlers_to_notify(self):
+        # Combine each event's handlers and all-event handlers into one unique tuple (in case some handlers are
+        # registered for both), so posting an event doesn't need to do it each time.
+        all_event_handlers = self.__event_handlers.get(self.__ALL_EVENTS, {})
+
+        handlers_by_event: Dict[str, Tuple[Callable, ...]] = {}
+        for event, handlers in self.__event_handlers.items():
+            if event != self.__ALL_EVENTS:
+                handlers_by_event[event] = tuple({**handlers, **all_event_handlers})
+
+        # Replace snapshot in one assignment (so readers always see a consistent pair).
+        self.__handlers_to_notify = (handlers_by_event, tuple(all_event_handlers))
+
     @staticmethod
     def __validate_events(events: [str]):
         invalid_events = []
@@ -358,6 +569,10 @@ class EventDispatch:
         name = EventDispatchEvent.HANDLER_REGISTERED.namespaced_value if is_registered else \
             EventDispatchEvent.HANDLER_UNREGISTERED.namespaced_value
 
+        # Skip building admin event (and its payload) if it won't be delivered or logged.
+        if not self.has_handlers(name) and not (self.__log_event and self.__log_event_if_no_handlers):
+            return
+
         # Replace internal marking for 'all events' with an empty list.
         if events == [self.__ALL_EVENTS]:
             events = []
@@ -367,20 +582,19 @@ class EventDispatch:
         })
 
     def __log_message_registered(self, handler: Callable, events: [str]):
-        message = f"Registered '{handler}'for event(s): {events}"
-        self.__logger.debug(message)
+        self.__logger.debug("Registered '%s' for event(s): %s", handler, events)
 
     def __log_message_unregistered(self, handler: Callable, events: [str]):
-        message = f"Unregistered '{handler}' from event(s): {events}"
-        self.__logger.debug(message)
+        self.__logger.debug("Unregistered '%s' from event(s): %s", handler, events)
 
     def __log_message_not_propagating_event(self, event: str):
-        message = f"Not propagating '{event}'...no handlers for it"
-        self.__logger.debug(message)
+        self.__logger.debug("Not propagating '%s'...no handlers for it", event)
+
+    def __log_message_handler_failed(self, handler: Callable, event: Event, exception: BaseException = None):
+        self.__logger.error("Handler '%s' failed handling event '%s'", handler, event.name, exc_info=exception or True)
 
     def __log_message_posted_event(self, event: Event):
-        message = f"Posted event '{event.name}'"
-        self.__logger.debug(message)
+        self.__logger.debug("Posted event '%s'", event.name)
 
 
 class EventDispatchManager:
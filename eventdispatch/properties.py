@@ -4,64 +4,66 @@ from eventdispatch import NotifiableError
 
 
 class Properties:
+    __slots__ = ('__values', '__mutable_property_names')
+
     __instance = None
-    __properties = {}
 
     def __new__(cls):
         if not cls.__instance:
-            cls.__instance = super().__new__(cls)
+            instance = super().__new__(cls)
+
+            # Property values, and names of properties that are allowed to be modified.
+            instance.__values = {}
+            instance.__mutable_property_names = set()
+            cls.__instance = instance
         return cls.__instance
 
     @staticmethod
     def has(property_name: str) -> bool:
-        return Properties().__has(property_name)
+        return Properties.__instance.__has(property_name)
 
     def __has(self, property_name: str) -> bool:
-        return property_name in self.__properties
+        return property_name in self.__values
 
     @staticmethod
     def get(property_name: str) -> Any:
-        return Properties().__get(property_name)
+        return Properties.__instance.__get(property_name)
 
     def __get(self, property_name: str) -> Any:
         try:
-            p = self.__properties[property_name]
-            return p.get('value')
+            return self.__values[property_name]
         except KeyError:
-            raise PropertyNotSetError(property_name)
+            raise PropertyNotSetError(property_name) from None
 
     @staticmethod
     def set(property_name: str, value: Any, is_mutable=False, is_skip_if_exists=False):
-        Properties().__set(property_name, value, is_mutable, is_skip_if_exists)
+        Properties.__instance.__set(property_name, value, is_mutable, is_skip_if_exists)
 
     def __set(self, property_name: str, value: Any, is_mutable=False, is_skip_if_exists=False):
-        try:
-            # Check if property exists.
-            p = self.__properties[property_name]
+        if property_name not in self.__values:
+            # First time setting property.
+            self.__values[property_name] = value
+            if is_mutable:
+                self.__mutable_property_names.add(property_name)
+            return
 
-            # Check if property should be skipped.
-            if is_skip_if_exists:
-                return
+        # Check if property should be skipped.
+        if is_skip_if_exists:
+            return
 
-            # Check if property is allowed to be modified.
-            if not p['is_mutable']:
-                raise ImmutablePropertyModificationError(property_name, p['value'], value)
+        # Check if property is allowed to be modified.
+        if property_name not in self.__mutable_property_names:
+            raise ImmutablePropertyModificationError(property_name, self.__values[property_name], value)
 
-            # Update property.
-            p['value'] = value
-        except KeyError:
-            # First time setting property.
-            self.__properties[property_name] = {
-                'value': value,
-                'is_mutable': is_mutable
-            }
+        # Update property.
+        self.__values[property_name] = value
 
     @staticmethod
     def get_list() -> [str]:
-        return Properties().__get_list()
+        return Properties.__instance.__get_list()
 
     def __get_list(self) -> [str]:
-        return list(self.__properties.keys())
+        return list(self.__values)
 
 
 class PropertyNotSetError(NotifiableError):
@@ -84,3 +86,7 @@ class ImmutablePropertyModificationError(NotifiableError):
             'new_value': new_value
         }
         super().__init__(message, error, payload)
+
+
+# Create singleton up front (so static methods can use it directly, instead of going through "Properties()" each time).
+Properties()
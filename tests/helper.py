@@ -1,3 +1,4 @@
+import asyncio
 from typing import Callable, Any, Dict
 
 import pytest
@@ -5,8 +6,16 @@ import pytest
 from eventdispatch import Event, EventDispatch
 from eventdispatch.core import EventDispatchEvent, EventDispatchManager
 
+# Default event dispatch (same one for the whole test run), kept here so helpers don't need to look it up each call.
+event_dispatch = EventDispatchManager().default_dispatch
+
+# Name of event posted when a handler is registered (which validation can ignore).
+registration_event = EventDispatch.to_string_event(EventDispatchEvent.HANDLER_REGISTERED)
+
 
 class EventHandler:
+    __slots__ = ('received_events',)
+
     def __init__(self):
         self.received_events = {}
 
@@ -20,8 +29,16 @@ class EventHandler:
         self.received_events[event.name] = event
 
 
+class AsyncEventHandler(EventHandler):
+    __slots__ = ()
+
+    async def on_event(self, event: Event):
+        await asyncio.sleep(0)
+        super().on_event(event)
+
+
 def register_handler_for_event(handler, event=None):
-    event_log_count = len(EventDispatchManager().default_dispatch.event_log)
+    event_log_count = len(event_dispatch.event_log)
     handler_count = get_handler_count()
 
     events = [event] if event else []
@@ -32,19 +49,15 @@ def register_handler_for_event(handler, event=None):
 
 
 def register(handler: EventHandler, events: [str]):
-    EventDispatchManager().default_dispatch.register(handler.on_event, events)
+    event_dispatch.register(handler.on_event, events)
 
 
 def get_handler_count():
-    count = 0
-
-    for event_name, handlers in EventDispatchManager().default_dispatch.event_handlers.items():
-        count += len(handlers)
-    return count
+    return event_dispatch.handler_count
 
 
 def validate_event_log_count(expected_count: int):
-    assert len(EventDispatchManager().default_dispatch.event_log) == expected_count
+    assert len(event_dispatch.event_log) == expected_count
 
 
 def validate_expected_handler_count(expected_count: int):
@@ -62,28 +75,22 @@ def validate_test_handler_registered_for_event(handler: EventHandler, event: str
 def validate_handler_registered_for_event(handler: Callable, event: str = None):
     # Check if validating for all events.
     if not event:
-        handlers = EventDispatchManager().default_dispatch.all_event_handlers
+        handlers = event_dispatch.all_event_handlers
     else:
-        handlers = EventDispatchManager().default_dispatch.event_handlers.get(event, [])
+        handlers = event_dispatch.event_handlers.get(event, [])
     assert handler in handlers
 
 
 def validate_received_events(handler: EventHandler, expected_events: [Any], is_ignore_registration_event=True):
     expected_events = EventDispatch.to_string_events(expected_events)
-    registration_event = EventDispatch.to_string_event(EventDispatchEvent.HANDLER_REGISTERED)
     if is_ignore_registration_event:
-        if registration_event in handler.received_events:
-            handler.received_events.pop(registration_event)
+        handler.received_events.pop(registration_event, None)
 
     assert len(handler.received_events) == len(expected_events)
-
-    validated_events = []
-    for expected_event in expected_events:
-        assert expected_event in handler.received_events
-        validated_events.append(expected_event)
+    assert not set(expected_events) - handler.received_events.keys()
 
     # Remove received events that have been validated.
-    for event in validated_events:
+    for event in expected_events:
         handler.received_events.pop(event)
 
 
@@ -2,7 +2,7 @@ from typing import Dict, Any
 
 import pytest
 
-from eventdispatch import Data, InvalidDataError, MissingKeyError
+from eventdispatch import Data, Event, InvalidDataError, MissingKeyError
 
 
 def setup_module():
@@ -229,3 +229,60 @@ def test_subclass__when_no_additional_params():
 
     assert value == 'value'
     assert num == 50
+
+
+def test_event__dict_and_get_match_properties():
+    # Objective:
+    # Event's dictionary form (and get call) have the same data as the event's properties.
+
+    # Setup
+    payload = {
+        'key': 'value'
+    }
+    event = Event('test_event', payload)
+
+    # Test
+    event_dict = event.dict
+
+    # Verify
+    assert event_dict == {
+        'id': event.id,
+        'time': event.time,
+        'name': 'test_event',
+        'payload': payload
+    }
+    assert event.dict is event_dict
+    assert event.get('name') == 'test_event'
+    assert event.get('key', event.payload) == 'value'
+
+
+def test_event__from_dict__when_id_and_time_in_data():
+    # Objective:
+    # Event is restored as-is (keeping its ID and time).
+
+    # Setup
+    event = Event('test_event', {'key': 'value'})
+
+    # Test
+    restored_event = Event.from_dict(event.dict)
+
+    # Verify
+    assert restored_event.dict == event.dict
+
+
+def test_event__from_dict__when_only_name_in_data():
+    # Objective:
+    # Event is created with new ID and time, and an empty payload.
+
+    # Setup
+    data = {
+        'name': 'test_event'
+    }
+
+    # Test
+    event = Event.from_dict(data)
+
+    # Verify
+    assert event.name == 'test_event'
+    assert event.payload == {}
+    assert event.id > 0
@@ -1,9 +1,14 @@
+import asyncio
+import threading
 import time
 from typing import Any, Dict
+from unittest import mock
+
+import pytest
 
 from eventdispatch import EventDispatch
 from eventdispatch.core import EventDispatchEvent, EventDispatchManager
-from helper import EventHandler, validate_test_handler_registered_for_event, \
+from helper import EventHandler, AsyncEventHandler, validate_test_handler_registered_for_event, \
     validate_handler_registered_for_all_events, validate_event_log_count, validate_expected_handler_count, \
     register_handler_for_event, register, validate_received_events
 
@@ -156,7 +161,7 @@ def test_register__confirm_registration_event_is_posted():
     # Setup
     global handler1, all_event_handler
     register_handler_for_event(all_event_handler)
-    time.sleep(0.1)
+    assert event_dispatch.wait_for_idle(timeout=1)
     validate_received_events(all_event_handler, [EventDispatchEvent.HANDLER_REGISTERED],
                              is_ignore_registration_event=False)
     test_event = 'test_event'
@@ -165,7 +170,7 @@ def test_register__confirm_registration_event_is_posted():
     register(handler1, [test_event])
 
     # Verify
-    time.sleep(0.1)
+    assert event_dispatch.wait_for_idle(timeout=1)
     validate_received_events(all_event_handler, [EventDispatchEvent.HANDLER_REGISTERED],
                              is_ignore_registration_event=False)
 
@@ -219,7 +224,7 @@ def test_post_event__when_no_registered_handlers_but_have_all_event_registered_h
 
     # Verify
     validate_event_log_count(2)
-    time.sleep(0.1)
+    assert event_dispatch.wait_for_idle(timeout=1)
     validate_received_events(all_event_handler, [test_event])
 
 
@@ -238,7 +243,7 @@ def test_post_event_when_registered_handler_for_event():
 
     # Verify
     validate_event_log_count(2)
-    time.sleep(0.1)
+    assert event_dispatch.wait_for_idle(timeout=1)
     validate_received_events(handler1, [test_event])
 
 
@@ -258,7 +263,7 @@ def test_post_event__when_registered_handler_and_different_all_event_registered_
 
     # Verify
     validate_event_log_count(3)
-    time.sleep(0.1)
+    assert event_dispatch.wait_for_idle(timeout=1)
     validate_received_events(handler1, [test_event])
     validate_received_events(all_event_handler, [test_event])
 
@@ -282,7 +287,7 @@ def test_post_event__when_same_registered_and_all_event_registered_handlers():
 
     # Verify
     validate_event_log_count(3)
-    time.sleep(0.1)
+    assert event_dispatch.wait_for_idle(timeout=1)
     validate_received_events(handler1, [test_event])
 
 
@@ -301,9 +306,68 @@ def test_post_event__when_two_registered_handlers_for_same_event():
 
     # Verify
     validate_event_log_count(3)
-    time.sleep(0.1)
+    assert event_dispatch.wait_for_idle(timeout=1)
+    validate_received_events(handler1, [test_event])
+    validate_received_events(handler2, [test_event])
+
+
+def test_post_event__when_registered_handler_and_all_event_handler__registrations_unchanged():
+    # Objective:
+    # Posting an event doesn't change registrations (all-event handler isn't added to the event's handlers).
+
+    # Setup
+    global handler1, all_event_handler
+    test_event = 'test_event'
+    register_handler_for_event(handler1, test_event)
+    register_handler_for_event(all_event_handler)
+
+    # Test
+    post_event(test_event)
+
+    # Verify
+    validate_expected_handler_count(2)
+    assert event_dispatch.event_handlers[test_event] == [handler1.on_event]
+
+
+def test_post_event__when_excluded_handler():
+    # Objective:
+    # Event is propagated to registered handlers, except for the excluded handler.
+
+    # Setup
+    global handler1, handler2, all_event_handler
+    test_event = 'test_event'
+    register_handler_for_event(handler1, test_event)
+    register_handler_for_event(handler2, test_event)
+    register_handler_for_event(all_event_handler)
+
+    # Test
+    event_dispatch.post_event(test_event, exclude_handler=all_event_handler.on_event)
+
+    # Verify
+    validate_event_log_count(4)
+    assert event_dispatch.wait_for_idle(timeout=1)
     validate_received_events(handler1, [test_event])
     validate_received_events(handler2, [test_event])
+    validate_received_events(all_event_handler, [])
+
+
+def test_post_event__when_registered_async_handler_for_event():
+    # Objective:
+    # One event is propagated (to registered async handler).
+    # Registered async handler is run to completion, and received the event.
+
+    # Setup
+    async_handler = AsyncEventHandler()
+    test_event = 'test_event'
+    register_handler_for_event(async_handler, test_event)
+
+    # Test
+    post_event(test_event)
+
+    # Verify
+    validate_event_log_count(2)
+    assert event_dispatch.wait_for_idle(timeout=1)
+    validate_received_events(async_handler, [test_event])
 
 
 def test_post_event__when_registered_handler_for_different_event():
@@ -325,6 +389,200 @@ def test_post_event__when_registered_handler_for_different_event():
     validate_received_events(handler1, [])
 
 
+def test_post_event__when_handler_busy__events_received_in_order():
+    # Objective:
+    # Handler receives events in the order they were posted (even when still handling an earlier event).
+
+    # Setup
+    received_events = []
+    test_events = ['test_event1', 'test_event2', 'test_event3']
+
+    def on_event(event):
+        time.sleep(0.01 if event.name == test_events[0] else 0)
+        received_events.append(event.name)
+
+    event_dispatch.register(on_event, test_events)
+
+    # Test
+    for test_event in test_events:
+        post_event(test_event)
+
+    # Verify
+    assert event_dispatch.wait_for_idle(timeout=1)
+    assert received_events == test_events
+
+
+@pytest.mark.filterwarnings('ignore::pytest.PytestUnhandledThreadExceptionWarning')
+def test_post_event__when_handler_raises_base_exception__later_events_still_received():
+    # Objective:
+    # Handler still receives its later events after raising an exception that's not caught (e.g. SystemExit).
+
+    # Setup
+    received_events = []
+    raising_threads = []
+    test_events = ['test_event1', 'test_event2']
+
+    def on_event(event):
+        if event.name == test_events[0]:
+            time.sleep(0.01)
+            raising_threads.append(threading.current_thread())
+            raise SystemExit
+        received_events.append(event.name)
+
+    event_dispatch.register(on_event, test_events)
+
+    # Test
+    for test_event in test_events:
+        post_event(test_event)
+
+    # Verify
+    assert event_dispatch.wait_for_idle(timeout=1)
+    assert received_events == [test_events[1]]
+
+    # Wait for handler thread that raised the exception to end (with that exception).
+    raising_threads[0].join(timeout=1)
+
+
+def test_post_event__when_thread_cannot_be_started__later_events_still_received():
+    # Objective:
+    # Posting fails when no thread can be started to notify handler, but handler still gets events posted afterwards.
+
+    # Setup
+    global handler1
+    new_event_dispatch = EventDispatch()
+    test_event1 = 'test_event1'
+    test_event2 = 'test_event2'
+    new_event_dispatch.register(handler1.on_event, [test_event1, test_event2])
+
+    # Test
+    with mock.patch('threading.Thread.start', side_effect=RuntimeError("can't start new thread")):
+        try:
+            new_event_dispatch.post_event(test_event1)
+            pytest.fail('Expected to get exception')
+        except RuntimeError:
+            pass
+    new_event_dispatch.post_event(test_event2)
+
+    # Verify
+    assert new_event_dispatch.wait_for_idle(timeout=1)
+    validate_received_events(handler1, [test_event2])
+
+
+def test_post_event__when_synchronous_dispatch():
+    # Objective:
+    # Registered handler received the event before posting the event returns.
+
+    # Setup
+    global handler1
+    synchronous_dispatch = EventDispatch(is_synchronous=True)
+    test_event = 'test_event'
+    synchronous_dispatch.register(handler1.on_event, [test_event])
+
+    # Test
+    synchronous_dispatch.post_event(test_event)
+
+    # Verify
+    validate_received_events(handler1, [test_event])
+
+
+def test_post_event__when_synchronous_dispatch__async_handler__posted_from_event_loop():
+    # Objective:
+    # Async handler is run on the event loop the event was posted from (which is already running).
+
+    # Setup
+    async_handler = AsyncEventHandler()
+    synchronous_dispatch = EventDispatch(is_synchronous=True)
+    test_event = 'test_event'
+    synchronous_dispatch.register(async_handler.on_event, [test_event])
+
+    async def post_from_event_loop():
+        synchronous_dispatch.post_event(test_event)
+
+        # Let handler's task (scheduled on this loop) run to completion.
+        await asyncio.gather(*[task for task in asyncio.all_tasks() if task is not asyncio.current_task()])
+
+    # Test
+    asyncio.run(post_from_event_loop())
+
+    # Verify
+    assert synchronous_dispatch.wait_for_idle(timeout=0)
+    validate_received_events(async_handler, [test_event])
+
+
+def test_has_handlers():
+    # Objective:
+    # Event has handlers only when a handler is registered for it, or for all events.
+
+    # Setup
+    global handler1, all_event_handler
+    test_event1 = 'test_event1'
+    test_event2 = 'test_event2'
+
+    # Test
+    register(handler1, [test_event1])
+
+    # Verify
+    assert event_dispatch.has_handlers(test_event1)
+    assert not event_dispatch.has_handlers(test_event2)
+
+    register(all_event_handler, [])
+    assert event_dispatch.has_handlers(test_event2)
+
+
+def test_wait_for_idle__when_handler_posts_event():
+    # Objective:
+    # Waiting returns once both the posted event, and the event posted by its handler, have been handled.
+
+    # Setup
+    global handler2
+    test_event1 = 'test_event1'
+    test_event2 = 'test_event2'
+
+    def on_test_event1(_):
+        time.sleep(0.05)
+        post_event(test_event2)
+
+    event_dispatch.register(on_test_event1, [test_event1])
+    register_handler_for_event(handler2, test_event2)
+
+    # Test
+    post_event(test_event1)
+    is_idle = event_dispatch.wait_for_idle(timeout=1)
+
+    # Verify
+    assert is_idle
+    validate_received_events(handler2, [test_event2])
+
+
+def test_post_event__when_many_handlers_block__other_handlers_still_notified():
+    # Objective:
+    # Handlers that block (waiting for another event) don't keep the handler of that other event from being notified.
+
+    # Setup
+    handler_count = 64
+    wait_event = 'wait_event'
+    open_gate_event = 'open_gate_event'
+    gate = threading.Event()
+    results = []
+
+    def create_waiting_handler():
+        def on_wait_event(_):
+            results.append(gate.wait(timeout=2))
+        return on_wait_event
+
+    for _ in range(handler_count):
+        event_dispatch.register(create_waiting_handler(), [wait_event])
+    event_dispatch.register(lambda _: gate.set(), [open_gate_event])
+
+    # Test
+    post_event(wait_event)
+    post_event(open_gate_event)
+
+    # Verify
+    assert event_dispatch.wait_for_idle(timeout=3)
+    assert results == [True] * handler_count
+
+
 def test_unregister__when_not_registered():
     # Objective:
     # Previous handlers remain intact.
@@ -415,7 +673,7 @@ def test_unregister__confirm_unregistration_event_is_posted():
     unregister(handler1, [test_event])
 
     # Verify
-    time.sleep(0.1)
+    assert event_dispatch.wait_for_idle(timeout=1)
     validate_received_events(all_event_handler,
                              [EventDispatchEvent.HANDLER_REGISTERED, EventDispatchEvent.HANDLER_UNREGISTERED],
                              is_ignore_registration_event=False)
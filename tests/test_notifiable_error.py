@@ -1,5 +1,3 @@
-import time
-
 from eventdispatch import NotifiableError, EventDispatch
 from eventdispatch.core import EventDispatchManager
 from helper import EventHandler, register_handler_for_event, validate_received_event
@@ -69,7 +67,7 @@ def test_notifiable_error__when_error_not_in_payload():
     # Event name is the error type, and payload has a key 'error' with value set to error type.
 
     # Setup
-    global handler
+    global event_dispatch, handler
     register_handler_for_event(handler, TEST_ERROR1)
     expected_payload = {
         TEST_KEY: TEST_VALUE,
@@ -84,7 +82,7 @@ def test_notifiable_error__when_error_not_in_payload():
         pass
 
     # Verify
-    time.sleep(0.1)
+    assert event_dispatch.wait_for_idle(timeout=1)
     validate_received_event(handler, TEST_ERROR1, expected_payload)
 
 
@@ -93,7 +91,7 @@ def test_notifiable_error__when_error_in_payload():
     # Event name is the error type, and payload has a key 'error' with same value that was set there before.
 
     # Setup
-    global handler
+    global event_dispatch, handler
     register_handler_for_event(handler, TEST_ERROR2)
     expected_payload = {
         TEST_KEY: TEST_VALUE,
@@ -108,5 +106,44 @@ def test_notifiable_error__when_error_in_payload():
         pass
 
     # Verify
-    time.sleep(0.1)
+    assert event_dispatch.wait_for_idle(timeout=1)
     validate_received_event(handler, TEST_ERROR2, expected_payload)
+
+
+class ErrorWithExceptionError(NotifiableError):
+    def __init__(self, exception: Exception):
+        message = TEST_ERROR_MESSAGE
+        error = TEST_ERROR1
+        payload = {
+            TEST_KEY: TEST_VALUE
+        }
+        super().__init__(message, error, payload, exception)
+
+
+def test_notifiable_error__when_exception_provided():
+    # Objective:
+    # Payload has a key 'stacktrace' with the formatted stacktrace of the exception.
+
+    # Setup
+    global event_dispatch, handler
+    register_handler_for_event(handler, TEST_ERROR1)
+    expected_payload = {
+        TEST_KEY: TEST_VALUE,
+        'error': TEST_ERROR1,
+        'stacktrace': '',
+        'message': TEST_ERROR_MESSAGE
+    }
+
+    # Test
+    try:
+        try:
+            raise ValueError('test value error')
+        except ValueError as e:
+            raise ErrorWithExceptionError(e)
+    except ErrorWithExceptionError:
+        pass
+
+    # Verify
+    assert event_dispatch.wait_for_idle(timeout=1)
+    validate_received_event(handler, TEST_ERROR1, expected_payload)
+    assert 'ValueError: test value error' in handler.received_events[TEST_ERROR1].payload['stacktrace']
@@ -0,0 +1,102 @@
+import pytest
+
+from eventdispatch import Properties, PropertyNotSetError, ImmutablePropertyModificationError
+
+
+def setup_module():
+    pass
+
+
+def setup_function():
+    pass
+
+
+def teardown_function():
+    pass
+
+
+def teardown_module():
+    pass
+
+
+def test_get__when_not_set():
+    # Objective:
+    # Getting property is not allowed, exception is thrown.
+
+    # Setup
+    property_name = 'test_get__when_not_set'
+
+    # Test
+    try:
+        Properties.get(property_name)
+        pytest.fail('Expected to get exception')
+    except PropertyNotSetError:
+        pass
+
+    # Verify
+    assert not Properties.has(property_name)
+
+
+def test_set__when_not_set():
+    # Objective:
+    # Property is set, and can be retrieved.
+
+    # Setup
+    property_name = 'test_set__when_not_set'
+
+    # Test
+    Properties.set(property_name, 100)
+
+    # Verify
+    assert Properties.has(property_name)
+    assert Properties.get(property_name) == 100
+    assert property_name in Properties.get_list()
+
+
+def test_set__when_set__immutable():
+    # Objective:
+    # Modifying property is not allowed, exception is thrown, and value is unchanged.
+
+    # Setup
+    property_name = 'test_set__when_set__immutable'
+    Properties.set(property_name, 100)
+
+    # Test
+    try:
+        Properties.set(property_name, 200)
+        pytest.fail('Expected to get exception')
+    except ImmutablePropertyModificationError:
+        pass
+
+    # Verify
+    assert Properties.get(property_name) == 100
+
+
+def test_set__when_set__mutable():
+    # Objective:
+    # Property is modified.
+
+    # Setup
+    property_name = 'test_set__when_set__mutable'
+    Properties.set(property_name, 100, is_mutable=True)
+
+    # Test
+    Properties.set(property_name, 200)
+
+    # Verify
+    assert Properties.get(property_name) == 200
+
+
+def test_set__when_set__skip_if_exists():
+    # Objective:
+    # Property is not modified (and no exception is thrown, even though it's immutable).
+
+    # Setup
+    property_name = 'test_set__when_set__skip_if_exists'
+    Properties.set(property_name, 100)
+
+    # Test
+    Properties.set(property_name, 200, is_skip_if_exists=True)
+
+    # Verify
+    assert Properties.get(property_name) == 100